@@ -9,6 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+from forecast_store import read_forecasts, stored_columns
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,13 +19,19 @@ sns.set_palette("husl")
 
 print("=== AvoCast: Creating Additional Visualizations ===")
 
-# Load the data
-forecast = pd.read_csv('prophet_forecast.csv')
+# Load the data - only the forecast columns these charts use, for the
+# single series modeled in prophet_model.py (conventional, target region)
+target_region = pd.read_csv('avocado_target_region.csv', usecols=['region'])['region'].iloc[0]
+holidays = pd.read_csv('prophet_holidays.csv')
+available_columns = stored_columns('prophet_forecast_store')
+forecast_columns = ['yhat', 'yhat_lower', 'yhat_upper', 'trend', 'yearly', 'weekly']
+forecast_columns += [h for h in holidays['holiday'].unique() if h in available_columns]
+forecast = read_forecasts('prophet_forecast_store', columns=forecast_columns,
+                          regions=[target_region], types=['conventional'])
 train_data = pd.read_csv('prophet_train_data.csv')
 test_data = pd.read_csv('prophet_test_data.csv')
 
 # Convert date columns
-forecast['ds'] = pd.to_datetime(forecast['ds'])
 train_data['ds'] = pd.to_datetime(train_data['ds'])
 test_data['ds'] = pd.to_datetime(test_data['ds'])
 
@@ -139,7 +146,6 @@ plt.close()
 
 # 4. Holiday Effects Visualization
 print("Creating holiday effects visualization...")
-holidays = pd.read_csv('prophet_holidays.csv')
 holidays['ds'] = pd.to_datetime(holidays['ds'])
 
 # Get holiday effects from forecast
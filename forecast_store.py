@@ -0,0 +1,118 @@
+"""
+AvoCast - Forecast Store
+Partitioned Parquet storage for forecasts of every region and avocado type,
+with column, series and date-range selection on read
+"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columns identifying a forecast row; region and type become partition directories
+KEY_COLUMNS = ['region', 'type', 'ds']
+PARTITION_COLUMNS = ['region', 'type']
+
+# Store-wide schema written on first use, so reads never depend on which
+# partition file happens to be opened first
+SCHEMA_FILE = '_common_metadata'
+
+
+def write_forecasts(forecast, path, columns=None, float_dtype='float32'):
+    """
+    Write forecasts to a Parquet dataset partitioned by region and type.
+
+    Only the key columns plus ``columns`` are stored (all columns when None),
+    and float columns are downcast to ``float_dtype`` (None keeps float64).
+    Partitions present in ``forecast`` replace any previous data for those
+    series; other series already in the store are left untouched. Every
+    write to a store must use the same columns and dtypes as the first one.
+    """
+    missing = [col for col in KEY_COLUMNS if col not in forecast.columns]
+    if missing:
+        raise ValueError(f"Forecast is missing key columns: {missing}")
+
+    if columns is None:
+        columns = [col for col in forecast.columns if col not in KEY_COLUMNS]
+    data = forecast[KEY_COLUMNS + list(columns)].copy()
+    data['ds'] = pd.to_datetime(data['ds'])
+
+    if float_dtype is not None:
+        float_columns = data.select_dtypes(include='floating').columns
+        data[float_columns] = data[float_columns].astype(float_dtype)
+
+    # Sorting by date keeps row-group statistics tight for date-range reads
+    data = data.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+    schema = pa.Schema.from_pandas(data, preserve_index=False).remove_metadata()
+    existing = store_schema(path)
+    if existing is not None and not existing.equals(schema):
+        raise ValueError(
+            f"Forecast columns {schema.names} ({schema.types}) do not match the "
+            f"store at {path!r}: {existing.names} ({existing.types}). "
+            "Write to a new path to change the stored columns."
+        )
+
+    data.to_parquet(
+        path,
+        engine='pyarrow',
+        index=False,
+        partition_cols=PARTITION_COLUMNS,
+        existing_data_behavior='delete_matching',
+    )
+    if existing is None:
+        pq.write_metadata(schema, os.path.join(path, SCHEMA_FILE))
+    return data
+
+
+def read_forecasts(path, columns=None, regions=None, types=None, start=None, end=None):
+    """
+    Load forecasts from the store, reading only what was asked for.
+
+    ``columns`` selects value columns (all when None); ``regions`` and
+    ``types`` prune partitions; ``start``/``end`` bound ``ds`` inclusively.
+    """
+    filters = []
+    if regions is not None:
+        filters.append(('region', 'in', list(regions)))
+    if types is not None:
+        filters.append(('type', 'in', list(types)))
+    if start is not None:
+        filters.append(('ds', '>=', pd.Timestamp(start)))
+    if end is not None:
+        filters.append(('ds', '<=', pd.Timestamp(end)))
+
+    if columns is not None:
+        columns = KEY_COLUMNS + [col for col in columns if col not in KEY_COLUMNS]
+
+    forecast = pd.read_parquet(
+        path,
+        engine='pyarrow',
+        columns=columns,
+        filters=filters or None,
+        schema=_require_schema(path),
+    )
+    value_columns = [col for col in forecast.columns if col not in KEY_COLUMNS]
+    forecast = forecast[KEY_COLUMNS + value_columns]
+    return forecast.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+
+def store_schema(path):
+    """Return the store's schema, or None if nothing has been written yet."""
+    schema_path = os.path.join(path, SCHEMA_FILE)
+    if not os.path.exists(schema_path):
+        return None
+    return pq.read_schema(schema_path)
+
+
+def _require_schema(path):
+    schema = store_schema(path)
+    if schema is None:
+        raise FileNotFoundError(f"No forecast store schema found at {os.path.join(path, SCHEMA_FILE)!r}")
+    return schema
+
+
+def stored_columns(path):
+    """Return the value columns available in the store."""
+    return [name for name in _require_schema(path).names if name not in KEY_COLUMNS]
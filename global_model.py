@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+AvoCast - Global Cross-Series Model
+One model trained once over every region and avocado type, benchmarked
+against the per-series Prophet approach from prophet_model.py
+"""
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
+from scipy.stats import norm
+from prophet import Prophet
+import holidays
+from datetime import timedelta
+from forecast_store import write_forecasts
+import logging
+import time
+import warnings
+warnings.filterwarnings('ignore')
+logging.getLogger('cmdstanpy').disabled = True  # Silence per-fit Stan progress logs
+
+# Set up plotting style
+plt.style.use('default')
+sns.set_palette("husl")
+
+# Model configuration
+FOURIER_ORDER = 10          # Yearly seasonality terms (Prophet's default order)
+HOLIDAY_WEEK_RADIUS = 3     # Holiday days within this many days of a weekly date flag that week
+RIDGE_DAMPING = 1e-3        # Small L2 penalty keeping the shared solve well conditioned
+INTERVAL_WIDTH = 0.80       # Same interval width as the Prophet model
+FORECAST_WEEKS = 52
+BENCHMARK_SERIES = None     # Number of series to refit with Prophet for comparison (None = all)
+
+print("=== AvoCast: Global Cross-Series Model ===")
+print("Shared seasonality and holidays, per-series level and trend")
+print("=" * 50)
+
+# Load the full dataset (all regions and types)
+print("Loading avocado dataset...")
+df = pd.read_csv('avocado.csv')
+df['Date'] = pd.to_datetime(df['Date'])
+
+panel = df[['region', 'type', 'Date', 'AveragePrice']].copy()
+panel.columns = ['region', 'type', 'ds', 'y']
+panel = panel.sort_values(['region', 'type', 'ds']).reset_index(drop=True)
+
+series_index = panel[['region', 'type']].drop_duplicates().reset_index(drop=True)
+n_series = len(series_index)
+panel['series_id'] = panel.groupby(['region', 'type'], sort=True).ngroup()
+print(f"Loaded {len(panel)} records across {n_series} series "
+      f"({panel['region'].nunique()} regions x {panel['type'].nunique()} types)")
+
+# Train/Test Split (80/20) on the shared weekly calendar
+print("\n" + "=" * 50)
+print("TRAIN/TEST SPLIT")
+print("=" * 50)
+
+split_date = pd.Series(panel['ds'].unique()).quantile(0.8)
+train_data = panel[panel['ds'] <= split_date].copy()
+test_data = panel[panel['ds'] > split_date].copy()
+
+print(f"Training data: {len(train_data)} records ({panel['ds'].min().strftime('%Y-%m-%d')} to {split_date.strftime('%Y-%m-%d')})")
+print(f"Test data: {len(test_data)} records ({test_data['ds'].min().strftime('%Y-%m-%d')} to {panel['ds'].max().strftime('%Y-%m-%d')})")
+
+# Holidays - same definitions as prophet_model.py
+print("\n" + "=" * 50)
+print("HOLIDAY SETUP")
+print("=" * 50)
+
+us_holidays = holidays.US(years=range(2015, 2020))
+holiday_df = pd.DataFrame([
+    {'holiday': 'thanksgiving', 'ds': pd.to_datetime(date), 'lower_window': -1, 'upper_window': 1}
+    for date, name in us_holidays.items()
+    if 'thanksgiving' in name.lower()
+])
+
+major_holidays = []
+for year in range(2015, 2020):
+    major_holidays.append({'holiday': 'new_years', 'ds': pd.to_datetime(f'{year}-01-01'), 'lower_window': 0, 'upper_window': 1})
+    super_bowl = pd.to_datetime(f'{year}-02-01')
+    while super_bowl.weekday() != 6:  # Sunday is 6
+        super_bowl += timedelta(days=1)
+    major_holidays.append({'holiday': 'super_bowl', 'ds': super_bowl, 'lower_window': -1, 'upper_window': 1})
+    major_holidays.append({'holiday': 'cinco_de_mayo', 'ds': pd.to_datetime(f'{year}-05-05'), 'lower_window': 0, 'upper_window': 1})
+
+holiday_df = pd.concat([holiday_df, pd.DataFrame(major_holidays)], ignore_index=True)
+holiday_names = sorted(holiday_df['holiday'].unique())
+
+# Expand each holiday into the individual days covered by its window
+holiday_days = {}
+for name in holiday_names:
+    rows = holiday_df[holiday_df['holiday'] == name]
+    days = [
+        (row['ds'] + timedelta(days=offset)).toordinal()
+        for _, row in rows.iterrows()
+        for offset in range(int(row['lower_window']), int(row['upper_window']) + 1)
+    ]
+    holiday_days[name] = np.array(days)
+
+print(f"Created {len(holiday_names)} shared holiday features: {', '.join(holiday_names)}")
+
+# Feature construction
+# Fourier and holiday columns are shared by every series, while the level and
+# trend columns are one-hot by series so each region/type keeps its own baseline.
+epoch = panel['ds'].min()
+n_shared = 2 * FOURIER_ORDER + len(holiday_names)
+
+
+def shared_features(ds):
+    """Yearly Fourier terms followed by weekly holiday indicators."""
+    ds = pd.DatetimeIndex(ds)
+    t_years = ((ds - pd.Timestamp('1970-01-01')).days.values / 365.25)[:, None]
+    k = np.arange(1, FOURIER_ORDER + 1)[None, :]
+    fourier = np.hstack([np.sin(2 * np.pi * k * t_years), np.cos(2 * np.pi * k * t_years)])
+
+    ordinals = np.array([d.toordinal() for d in ds])[:, None]
+    holiday_flags = np.column_stack([
+        (np.abs(ordinals - holiday_days[name][None, :]) <= HOLIDAY_WEEK_RADIUS).any(axis=1)
+        for name in holiday_names
+    ]).astype(float)
+    return np.hstack([fourier, holiday_flags])
+
+
+def trend_time(ds):
+    """Years elapsed since the first observation in the panel."""
+    return (pd.DatetimeIndex(ds) - epoch).days.values / 365.25
+
+
+def design_matrix(ds, series_ids):
+    """Sparse design: [shared | per-series level | per-series slope]."""
+    n = len(ds)
+    rows = np.arange(n)
+    level = sparse.csr_matrix((np.ones(n), (rows, series_ids)), shape=(n, n_series))
+    slope = sparse.csr_matrix((trend_time(ds), (rows, series_ids)), shape=(n, n_series))
+    return sparse.hstack([sparse.csr_matrix(shared_features(ds)), level, slope], format='csr')
+
+
+def predict_components(ds, series_ids):
+    """Return trend, yearly, holiday and total components for each row."""
+    features = shared_features(ds)
+    yearly = features[:, :2 * FOURIER_ORDER] @ shared_coef[:2 * FOURIER_ORDER]
+    holiday_effect = features[:, 2 * FOURIER_ORDER:] @ shared_coef[2 * FOURIER_ORDER:]
+    trend = level_coef[series_ids] + slope_coef[series_ids] * trend_time(ds)
+    return trend, yearly, holiday_effect, trend + yearly + holiday_effect
+
+
+# Fit the global model once over all series
+print("\n" + "=" * 50)
+print("GLOBAL MODEL TRAINING")
+print("=" * 50)
+
+start = time.perf_counter()
+X_train = design_matrix(train_data['ds'], train_data['series_id'].values)
+solution = lsqr(X_train, train_data['y'].values, damp=RIDGE_DAMPING, atol=1e-10, btol=1e-10)
+coef = solution[0]
+shared_coef = coef[:n_shared]
+level_coef = coef[n_shared:n_shared + n_series]
+slope_coef = coef[n_shared + n_series:]
+
+# Per-series residual spread drives the uncertainty interval
+train_fitted = predict_components(train_data['ds'], train_data['series_id'].values)[3]
+residual_std = (
+    pd.Series(train_data['y'].values - train_fitted)
+    .groupby(train_data['series_id'].values)
+    .std()
+    .reindex(range(n_series))
+    .values
+)
+interval_z = norm.ppf(0.5 + INTERVAL_WIDTH / 2)
+global_fit_seconds = time.perf_counter() - start
+
+print(f"Design matrix: {X_train.shape[0]} rows x {X_train.shape[1]} columns ({X_train.nnz} non-zeros)")
+print(f"Solved in {solution[2]} iterations")
+print(f"Global model training completed in {global_fit_seconds:.2f}s")
+
+# Evaluate on the test period
+print("\n" + "=" * 50)
+print("MODEL EVALUATION")
+print("=" * 50)
+
+test_pred = predict_components(test_data['ds'], test_data['series_id'].values)[3]
+test_data['yhat_global'] = test_pred
+test_data['abs_error'] = np.abs(test_data['y'] - test_data['yhat_global'])
+test_data['abs_pct_error'] = test_data['abs_error'] / test_data['y'] * 100
+test_data['sq_error'] = (test_data['y'] - test_data['yhat_global']) ** 2
+
+global_metrics = test_data.groupby('series_id').agg(
+    global_mae=('abs_error', 'mean'),
+    global_mape=('abs_pct_error', 'mean'),
+    global_rmse=('sq_error', lambda s: np.sqrt(s.mean())),
+)
+
+print(f"Test Set Performance (averaged over {n_series} series):")
+print(f"  - Mean Absolute Error (MAE): ${global_metrics['global_mae'].mean():.3f}")
+print(f"  - Mean Absolute Percentage Error (MAPE): {global_metrics['global_mape'].mean():.2f}%")
+print(f"  - Root Mean Square Error (RMSE): ${global_metrics['global_rmse'].mean():.3f}")
+
+# Generate future predictions for every series
+print("\n" + "=" * 50)
+print("FUTURE FORECASTING")
+print("=" * 50)
+
+future_dates = pd.DatetimeIndex(np.sort(train_data['ds'].unique())).append(
+    pd.date_range(start=train_data['ds'].max(), periods=FORECAST_WEEKS + 1, freq='W')[1:]
+)
+future = pd.DataFrame({
+    'series_id': np.repeat(np.arange(n_series), len(future_dates)),
+    'ds': np.tile(future_dates.values, n_series),
+})
+trend, yearly, holiday_effect, yhat = predict_components(future['ds'], future['series_id'].values)
+half_width = interval_z * residual_std[future['series_id'].values]
+
+forecast = series_index.iloc[future['series_id'].values].reset_index(drop=True)
+forecast['ds'] = future['ds'].values
+forecast['trend'] = trend
+forecast['yearly'] = yearly
+forecast['holidays'] = holiday_effect
+forecast['yhat'] = yhat
+forecast['yhat_lower'] = yhat - half_width
+forecast['yhat_upper'] = yhat + half_width
+print(f"Forecasting {FORECAST_WEEKS} weeks ahead for {n_series} series ({len(forecast)} rows)")
+
+# Benchmark against per-series Prophet fits
+print("\n" + "=" * 50)
+print("BENCHMARK: PER-SERIES PROPHET")
+print("=" * 50)
+
+benchmark_ids = range(n_series if BENCHMARK_SERIES is None else min(BENCHMARK_SERIES, n_series))
+prophet_rows = []
+prophet_fit_seconds = 0.0
+
+for series_id in benchmark_ids:
+    series_train = train_data[train_data['series_id'] == series_id][['ds', 'y']]
+    series_test = test_data[test_data['series_id'] == series_id][['ds', 'y']]
+
+    # Same configuration as prophet_model.py
+    model = Prophet(
+        yearly_seasonality=True,
+        weekly_seasonality=True,
+        daily_seasonality=False,
+        holidays=holiday_df,
+        seasonality_mode='additive',
+        changepoint_prior_scale=0.05,
+        holidays_prior_scale=10.0,
+        seasonality_prior_scale=10.0,
+        interval_width=INTERVAL_WIDTH
+    )
+    start = time.perf_counter()
+    model.fit(series_train)
+    prophet_fit_seconds += time.perf_counter() - start
+
+    predicted = model.predict(series_test[['ds']])['yhat'].values
+    actual = series_test['y'].values
+    prophet_rows.append({
+        'series_id': series_id,
+        'prophet_mae': np.mean(np.abs(actual - predicted)),
+        'prophet_mape': np.mean(np.abs((actual - predicted) / actual)) * 100,
+        'prophet_rmse': np.sqrt(np.mean((actual - predicted) ** 2)),
+    })
+
+benchmark = (
+    series_index.join(global_metrics)
+    .join(pd.DataFrame(prophet_rows).set_index('series_id'), how='inner')
+)
+n_benchmarked = len(benchmark)
+global_wins = (benchmark['global_mape'] < benchmark['prophet_mape']).sum()
+prophet_fit_estimate = prophet_fit_seconds / n_benchmarked * n_series
+
+print(f"Benchmarked {n_benchmarked} series")
+print(f"\n{'Metric':<12}{'Global':>12}{'Prophet':>12}")
+print(f"{'MAE ($)':<12}{benchmark['global_mae'].mean():>12.3f}{benchmark['prophet_mae'].mean():>12.3f}")
+print(f"{'MAPE (%)':<12}{benchmark['global_mape'].mean():>12.2f}{benchmark['prophet_mape'].mean():>12.2f}")
+print(f"{'RMSE ($)':<12}{benchmark['global_rmse'].mean():>12.3f}{benchmark['prophet_rmse'].mean():>12.3f}")
+print(f"\nGlobal model has lower MAPE on {global_wins}/{n_benchmarked} series")
+print(f"Fit time - global (all {n_series} series): {global_fit_seconds:.2f}s")
+print(f"Fit time - Prophet ({n_benchmarked} series): {prophet_fit_seconds:.2f}s "
+      f"(~{prophet_fit_estimate:.1f}s for all {n_series})")
+
+# Save results
+print("\n" + "=" * 50)
+print("SAVING RESULTS")
+print("=" * 50)
+
+write_forecasts(forecast, 'global_forecast_store')
+benchmark.to_csv('global_benchmark.csv', index=False)
+
+print("Files saved:")
+print("  - global_forecast_store/: Forecasts for every region and type (Parquet, partitioned by region/type)")
+print("  - global_benchmark.csv: Per-series accuracy of global vs Prophet models")
+
+# Benchmark visualization
+fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+
+limit = max(benchmark['global_mape'].max(), benchmark['prophet_mape'].max()) * 1.05
+colors = benchmark['type'].map({'conventional': 'steelblue', 'organic': 'seagreen'})
+axes[0].scatter(benchmark['prophet_mape'], benchmark['global_mape'], c=colors, alpha=0.7)
+axes[0].plot([0, limit], [0, limit], 'r--', alpha=0.7)
+axes[0].set_xlim(0, limit)
+axes[0].set_ylim(0, limit)
+axes[0].set_title('Test MAPE per Series (below line = global model better)')
+axes[0].set_xlabel('Per-series Prophet MAPE (%)')
+axes[0].set_ylabel('Global model MAPE (%)')
+
+fit_times = [global_fit_seconds, prophet_fit_estimate]
+axes[1].bar(['Global (1 fit)', f'Prophet ({n_series} fits)'], fit_times, color=['seagreen', 'lightcoral'])
+axes[1].set_title('Training Time for All Series')
+axes[1].set_ylabel('Seconds')
+for i, v in enumerate(fit_times):
+    axes[1].text(i, v + max(fit_times) * 0.01, f'{v:.1f}s', ha='center', va='bottom')
+
+plt.suptitle('AvoCast: Global Model vs Per-Series Prophet', fontsize=16)
+plt.tight_layout()
+plt.savefig('global_model_benchmark.png', dpi=300, bbox_inches='tight')
+plt.close()
+
+print("  - global_model_benchmark.png: Accuracy and training time comparison")
+
+print("\n" + "=" * 50)
+print("GLOBAL MODEL DEVELOPMENT COMPLETE")
+print("=" * 50)
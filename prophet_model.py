@@ -13,6 +13,7 @@ from prophet.diagnostics import cross_validation, performance_metrics
 from prophet.plot import plot_cross_validation_metric
 import holidays
 from datetime import datetime, timedelta
+from forecast_store import write_forecasts
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -193,14 +194,21 @@ print("=" * 50)
 # Save the model data
 train_data.to_csv('prophet_train_data.csv', index=False)
 test_data.to_csv('prophet_test_data.csv', index=False)
-forecast.to_csv('prophet_forecast.csv', index=False)
 holiday_df.to_csv('prophet_holidays.csv', index=False)
 
+# Store only the columns used downstream, in float32, partitioned by series
+store_columns = ['yhat', 'yhat_lower', 'yhat_upper', 'trend', 'yearly', 'weekly', 'holidays']
+store_columns += [h for h in holiday_df['holiday'].unique() if h in forecast.columns]
+forecast_export = forecast.copy()
+forecast_export['region'] = conventional_data['region'].iloc[0]
+forecast_export['type'] = conventional_data['type'].iloc[0]
+write_forecasts(forecast_export, 'prophet_forecast_store', columns=store_columns)
+
 print("Files saved:")
 print("  - prophet_train_data.csv: Training dataset")
 print("  - prophet_test_data.csv: Test dataset") 
-print("  - prophet_forecast.csv: Complete forecast results")
 print("  - prophet_holidays.csv: Holiday definitions")
+print("  - prophet_forecast_store/: Forecast results (Parquet, partitioned by region/type)")
 
 # Create basic visualizations
 print("\n" + "=" * 50)